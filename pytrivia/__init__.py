@@ -14,5 +14,10 @@ __license__ = 'GPLv3'
 
 
 from .client import Client
+try:
+    from .async_client import AsyncClient
+except ModuleNotFoundError as e:  # httpx is optional (pytrivia[async])
+    if e.name != 'httpx':
+        raise
 from .question import Question
 from .exceptions import NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode, HttpError
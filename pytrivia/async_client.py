@@ -0,0 +1,237 @@
+#!python
+# coding: utf-8
+
+"""
+AsyncClient - Communicates with OpenTriviaDB API asynchronously.
+"""
+
+import asyncio
+import httpx
+from .client import _ClientBase, _question_fields
+from .question import Question
+from .exceptions import TokenNotFound, TokenEmpty
+
+
+class AsyncClient(_ClientBase):
+    """
+    Asynchronous pyTrivia client, built on httpx (requires httpx[http2]).
+    Mirrors Client, but its requests are coroutines, so several get_questions calls can run concurrently
+    (ex: asyncio.gather) over a single HTTP/2 connection pool.
+
+    Must be initialized before use, either with 'async with AsyncClient() as client'
+    or with 'client = await AsyncClient.create()' (followed by 'await client.aclose()').
+
+    Attributes
+    ----------
+    MAIN_URL, API_URL, TOKEN_URL, ALL_CATEGORIES_URL, CATEGORIES_COUNT_URL, ALL_CATEGORIES_COUNTS_URL : str
+        Same as in Client.
+    HTTP_HEADER : dict
+        HTTP header sent with every request.
+    HTTP_RETRIES : int
+        Retries for failed connections. Unlike Client, requests are not retried on transient HTTP errors (5xx, 429).
+    HTTP_LIMITS : httpx.Limits
+        Connection pool limits.
+    CATEGORIES_CACHE_FILE : str
+        Local file where the category lookup is cached (shared with Client).
+    CATEGORIES_CACHE_TTL : int
+        Seconds after which the cached category lookup is considered stale.
+    token : str
+        Token in use.
+    categories : tuple
+        All available question categories.
+    difficulties : tuple
+        All available question difficulties.
+    types : tuple
+        All available question types.
+
+    Methods
+    -------
+    create(refresh_categories=False)
+        Creates and initializes an AsyncClient (coroutine).
+    get_questions(number=1, category=None, difficulty=None, _type=None)
+        Retrieves questions from the OpenTriviaDB API (coroutine).
+    aclose()
+        Closes the underlying HTTP client (coroutine).
+
+    Raises
+    ------
+    Same as Client.
+    """
+
+    # httpx only retries failed connections (not HTTP status codes, unlike Client.HTTP_RETRIES)
+    HTTP_RETRIES = 3
+    HTTP_LIMITS = httpx.Limits(max_connections=10)
+
+    def __init__(self, refresh_categories=False):
+        """
+        Creates the pyTrivia asynchronous client. No requests are performed until it is initialized
+        (async with, or AsyncClient.create).
+
+        Parameters
+        ----------
+        refresh_categories : bool, optional
+            Ignores the local categories cache and retrieves them from OpenTriviaDB if True.
+        """
+        super().__init__()
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=self.HTTP_LIMITS, retries=self.HTTP_RETRIES)
+        self._http = httpx.AsyncClient(headers=self.HTTP_HEADER, transport=transport)
+        self._refresh_categories = refresh_categories
+        self.token = None
+        self._categories_and_ids = None
+
+    @classmethod
+    async def create(cls, refresh_categories=False):
+        """
+        Creates and initializes a pyTrivia asynchronous client.
+        Performs 2 concurrent requests to the OpenTriviaDB API:
+            - Token request
+            - Available categories request (skipped if a fresh local cache exists)
+
+        Parameters
+        ----------
+        refresh_categories : bool, optional
+            Ignores the local categories cache and retrieves them from OpenTriviaDB if True.
+
+        Returns
+        -------
+        AsyncClient
+
+        Raises
+        ------
+        Same as Client.__init__.
+        """
+        client = cls(refresh_categories)
+        try:
+            await client._initialize()
+        except BaseException:
+            await client.aclose()
+            raise
+        return client
+
+    async def __aenter__(self):
+        if self.token is None:
+            try:
+                await self._initialize()
+            except BaseException:
+                await self.aclose()
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the underlying HTTP client and its pooled connections."""
+        await self._http.aclose()
+
+    async def get_questions(self, number=1, category=None, difficulty=None, _type=None):
+        """
+        Retrieves questions from OpenTriviaDB.
+
+        Parameters
+        ----------
+        number : int, optional
+            Number of questions to retrieve (0 < number <= 50).
+        category : str or None, optional
+            Question category. One of self.categories.
+        difficulty : str or None, optional
+            Question difficulty. One of self._difficulties
+        _type : str or None, optional
+            Type of question. One of self._types
+
+        Returns
+        -------
+        list(Question)
+
+        Raises
+        ------
+        RuntimeError
+            If the client was not initialized (async with, or AsyncClient.create).
+        Otherwise, same as Client.get_questions.
+        """
+        if self.token is None:
+            raise RuntimeError('AsyncClient is not initialized. '
+                               'Use \'async with AsyncClient() as client\' or \'await AsyncClient.create()\'.')
+        # number
+        if not (isinstance(number, int) and (0 < number <= 50)):
+            raise TypeError('Parameter \'number\' must be an int between 1 and 50')
+        filters = self._build_api_filters(category, difficulty, _type)
+
+        # handle token
+        try:
+            json = await self._request_resource(self._questions_url(number, filters))
+        except TokenNotFound:  # get a new token
+            self.token = await self._get_token()
+            # if this throws another TokenNotFound, something is up with the API...
+            json = await self._request_resource(self._questions_url(number, filters))
+        except TokenEmpty:  # reset token
+            self.token = await self._get_token(reset=True)
+            # if this throws another TokenEmpty, something is up with the API...
+            json = await self._request_resource(self._questions_url(number, filters))
+        return [Question(*_question_fields(question)) for question in json['results']]
+
+    async def _initialize(self):
+        """Retrieves the token and categories concurrently. See AsyncClient.create."""
+        self.token, self._categories_and_ids = await asyncio.gather(
+            self._get_token(), self._get_categories(self._refresh_categories))
+
+    async def _get_token(self, reset=False):
+        """
+        Retrieves an OpenTriviaDB session token. See Client._get_token.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Token is reset if True, a new token is retrieved otherwise.
+
+        Returns
+        -------
+        str
+            OpenTriviaDB session token.
+        """
+        json = await self._request_resource(self._token_url(reset))
+        return json['token']
+
+    async def _get_categories(self, refresh=False):
+        """
+        Retrieves all OpenTriviaDB categories and respective ids. See Client._get_categories.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Ignores the local cache and retrieves categories from OpenTriviaDB if True.
+
+        Returns
+        -------
+        dict
+            OpenTriviaDB categories (keys) and ids (values).
+        """
+        # the local cache is blocking file I/O, so it runs in a worker thread to keep the event loop free
+        if not refresh:
+            categories = await asyncio.to_thread(self._read_categories_cache)
+            if categories is not None:
+                return categories
+        json = await self._request_resource(self.ALL_CATEGORIES_URL, response_code=False)
+        categories = self._parse_categories(json)
+        await asyncio.to_thread(self._write_categories_cache, categories)
+        return categories
+
+    async def _request_resource(self, url, response_code=True):
+        """
+        Performs an HTTP request to an OpenTriviaDB url and retrieves the json response.
+        See Client._request_resource.
+
+        Parameters
+        ----------
+        url : str
+            The HTTP request will be made to this url.
+        response_code : bool
+            Whether to check for response_code or not
+
+        Returns
+        -------
+        dict
+            Parsed json response.
+        """
+        response = await self._http.get(url)
+        return self._parse_response(response.status_code, response.reason_phrase, response.content, response_code)
@@ -5,13 +5,313 @@
 Client - Communicates with OpenTriviaDB API.
 """
 
+import operator
+import os
+import json as _json
+import tempfile
+import time
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional (pytrivia[fast])
+    _loads = _json.loads
 from .question import Question
-from .exceptions import NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode, HttpError
+from .exceptions import TokenNotFound, TokenEmpty, UnexpectedResponseCode, HttpError, \
+    NO_RESULTS, INVALID_PARAMETER, TOKEN_NOT_FOUND, TOKEN_EMPTY
 from . import __version__
 
+# Question.__init__ positional arguments, in order, from an OpenTriviaDB 'results' entry
+_question_fields = operator.itemgetter('category', 'type', 'difficulty', 'question', 'correct_answer',
+                                       'incorrect_answers')
 
-class Client:
+
+class _ClientBase:
+    """
+    Network independent parts shared by Client and AsyncClient: OpenTriviaDB urls, parameter validation,
+    url building, the local categories cache and response parsing.
+    Subclasses perform the actual requests and must set self.token and self._categories_and_ids.
+    """
+
+    MAIN_URL = 'https://opentdb.com/'
+    API_URL = MAIN_URL + 'api.php'
+    TOKEN_URL = MAIN_URL + 'api_token.php'
+    ALL_CATEGORIES_URL = MAIN_URL + 'api_category.php'
+    CATEGORIES_COUNT_URL = MAIN_URL + 'api_count.php'
+    ALL_CATEGORIES_COUNTS_URL = MAIN_URL + 'api_count_global.php'
+
+    HTTP_HEADER = {
+        'User-Agent': 'pyTrivia/' + __version__,
+        'Content-Type': 'application/json'
+    }
+
+    CATEGORIES_CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                         'pytrivia', 'categories.json')
+    CATEGORIES_CACHE_TTL = 24 * 60 * 60
+
+    # OpenTriviaDB response codes (other than 0, success) and respective exceptions
+    _ERRORS = {1: NO_RESULTS, 2: INVALID_PARAMETER, 3: TOKEN_NOT_FOUND, 4: TOKEN_EMPTY}
+
+    def __init__(self):
+        """Initializes the available difficulties and types and the get_questions parameters cache."""
+        self._difficulties = ('easy', 'medium', 'hard')
+        self._types = ('multiple', 'boolean')
+        # O(1) membership tests for parameter validation, tuples are kept for display
+        self._difficulties_set = frozenset(self._difficulties)
+        self._types_set = frozenset(self._types)
+        # validated get_questions filters, keyed on (category, difficulty, _type).
+        # A plain dict holds no reference back to the client, so it doesn't create a reference cycle
+        self._api_filters = {}
+
+    @property
+    def categories(self):
+        """
+        Shows all available categories.
+
+        Returns
+        -------
+        tuple
+            Tuple of all valid categories.
+        """
+        return tuple(self._categories_and_ids)  # keys only, which are the category names
+
+    @property
+    def difficulties(self):
+        """Returns _difficulties. All available difficulties."""
+        return self._difficulties
+
+    @property
+    def types(self):
+        """Returns _types. All available types."""
+        return self._types
+
+    def _build_api_filters(self, category, difficulty, _type):
+        """
+        Returns the API url query parameters for the given get_questions parameters.
+        Results are cached per instance (self._api_filters), since the same parameters are usually requested
+        repeatedly. Invalid parameters raise and are not cached, so the cache is bounded by the valid combinations.
+
+        Parameters
+        ----------
+        category : str or None
+            Question category. One of self.categories.
+        difficulty : str or None
+            Question difficulty. One of self._difficulties
+        _type : str or None
+            Type of question. One of self._types
+
+        Returns
+        -------
+        tuple
+            (name, value) query parameter pairs, for every parameter that is not None.
+
+        Raises
+        ------
+        TypeError
+            If category is not a str in self.categories.
+            If difficulty is not a str in self._difficulties.
+            If _type is not a str in self._types.
+        """
+        key = (category, difficulty, _type)
+        filters = self._api_filters.get(key)
+        if filters is None:
+            filters = self._api_filters[key] = self._validate_api_filters(category, difficulty, _type)
+        return filters
+
+    def _validate_api_filters(self, category, difficulty, _type):
+        """
+        Validates get_questions parameters and converts them to API url query parameters.
+
+        Parameters
+        ----------
+        category : str or None
+            Question category. One of self.categories.
+        difficulty : str or None
+            Question difficulty. One of self._difficulties
+        _type : str or None
+            Type of question. One of self._types
+
+        Returns
+        -------
+        tuple
+            (name, value) query parameter pairs, for every parameter that is not None.
+
+        Raises
+        ------
+        TypeError
+            If category is not a str in self.categories.
+            If difficulty is not a str in self._difficulties.
+            If _type is not a str in self._types.
+        """
+        filters = []
+        # category
+        if category is not None:
+            category_id = self._categories_and_ids.get(category)
+            if category_id is None:
+                raise TypeError('Parameter \'category\' must be an existing category. '
+                                'Call Client.category to check available categories.')
+            filters.append(('category', category_id))
+        # difficulty
+        if difficulty is not None:
+            if difficulty not in self._difficulties_set:
+                raise TypeError(f'Parameter \'difficulty\' must be one of: {", ".join(self._difficulties)}')
+            filters.append(('difficulty', difficulty))
+        # _type
+        if _type is not None:
+            if _type not in self._types_set:
+                raise TypeError(f'Parameter \'_type\' must be one of: {", ".join(self._types)}')
+            filters.append(('type', _type))
+        return tuple(filters)
+
+    def _questions_url(self, number, filters):
+        """
+        Builds the API url for a questions request, using the current token.
+
+        Parameters
+        ----------
+        number : int
+            Number of questions to retrieve.
+        filters : tuple
+            Query parameters, as returned by _build_api_filters.
+
+        Returns
+        -------
+        str
+            API url.
+        """
+        query = urlencode((('amount', number), *filters, ('token', self.token)))
+        return f'{self.API_URL}?{query}'
+
+    def _token_url(self, reset=False):
+        """
+        Builds the OpenTriviaDB token handler url.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Url resets the current token if True, requests a new token otherwise.
+
+        Returns
+        -------
+        str
+            Token handler url.
+        """
+        if reset:
+            return f'{self.TOKEN_URL}?command=reset&token={self.token}'
+        return f'{self.TOKEN_URL}?command=request'
+
+    @staticmethod
+    def _parse_categories(json):
+        """
+        Extracts categories and respective ids from an OpenTriviaDB category lookup response.
+
+        Parameters
+        ----------
+        json : dict
+            Parsed category lookup response.
+
+        Returns
+        -------
+        dict
+            OpenTriviaDB categories (keys) and ids (values).
+        """
+        # Assumes json is structured as per the OpenTriviaDB documentation.
+        # Any error that arises from "wrong" dictionary keys is because json response was
+        # altered by OpenTriviaDB in the meanwhile.
+        return {category['name']: category['id'] for category in json['trivia_categories']}
+
+    def _read_categories_cache(self):
+        """
+        Reads the locally cached categories, if they exist and are not stale.
+
+        Returns
+        -------
+        dict or None
+            OpenTriviaDB categories (keys) and ids (values), or None if there is no usable cache.
+        """
+        try:
+            age = time.time() - os.path.getmtime(self.CATEGORIES_CACHE_FILE)
+            if not 0 <= age < self.CATEGORIES_CACHE_TTL:  # stale, or modified in the future (clock changes)
+                return None
+            with open(self.CATEGORIES_CACHE_FILE, 'rb') as cache:
+                categories = _loads(cache.read())
+        except (OSError, ValueError):  # missing, unreadable or corrupted cache
+            return None
+        return categories if isinstance(categories, dict) and categories else None
+
+    def _write_categories_cache(self, categories):
+        """
+        Atomically writes categories to the local cache. Failing to do so is not an error.
+
+        Parameters
+        ----------
+        categories : dict
+            OpenTriviaDB categories (keys) and ids (values).
+        """
+        cache_dir = os.path.dirname(self.CATEGORIES_CACHE_FILE)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
+                    _json.dump(categories, temp_file)
+                os.replace(temp_path, self.CATEGORIES_CACHE_FILE)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+
+    def _parse_response(self, status_code, reason, content, response_code=True):
+        """
+        Checks an OpenTriviaDB HTTP response and parses its json body.
+
+        Parameters
+        ----------
+        status_code : int
+            HTTP status code.
+        reason : str
+            HTTP text corresponding to status code.
+        content : bytes
+            HTTP response body.
+        response_code : bool
+            Whether to check for response_code or not
+
+        Returns
+        -------
+        dict
+            Parsed json response.
+
+        Raises
+        ------
+        ValueError
+            If the HTTP response body does not contain valid json (json decoding error).
+        HttpError
+            If the HTTP code is not 200 OK.
+        NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
+            If the OpenTriviaDB response code is not 0.
+        """
+        if status_code != 200:
+            raise HttpError(status_code, reason)
+        json = _loads(content)
+        if response_code:
+            # Assumes json is structured as per the OpenTriviaDB documentation.
+            # Any error that arises from "wrong" dictionary keys is because json response was
+            # altered by OpenTriviaDB in the meanwhile.
+            response_code = json['response_code']
+            if response_code:
+                error = self._ERRORS.get(response_code)
+                if error is None:
+                    raise UnexpectedResponseCode(str(response_code))
+                raise error._reset()
+        return json
+
+
+class Client(_ClientBase):
     """
     pyTrivia client.
     Handles all the communication with the OpenTriviaDB API, including token management.
@@ -32,6 +332,12 @@ class Client:
         Total question count lookup url.
     HTTP_HEADER : dict
         HTTP header sent with every request.
+    HTTP_RETRIES : urllib3.util.retry.Retry
+        Retry policy for failed connections and transient HTTP errors.
+    CATEGORIES_CACHE_FILE : str
+        Local file where the category lookup is cached.
+    CATEGORIES_CACHE_TTL : int
+        Seconds after which the cached category lookup is considered stale.
     token : str
         Token in use.
     categories : tuple
@@ -45,6 +351,8 @@ class Client:
     -------
     get_questions(number=1, category=None, difficulty=None, _type=None)
         Retrieves questions from the OpenTriviaDB API.
+    close()
+        Closes the underlying HTTP session.
 
     Raises
     ------
@@ -55,67 +363,64 @@ class Client:
         When calling get_questions, if _type is not a str in self.types.
     ValueError
         When calling __init__, get_questions, if the HTTP response body does not contain valid json
-        (request.json error).
+        (json decoding error).
     HttpError
         When calling __init__, get_questions, if the HTTP code is not 200 OK.
     NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
         When calling __init__, get_questions, if the OpenTriviaDB response code is not 0.
     """
 
-    MAIN_URL = 'https://opentdb.com/'
-    API_URL = MAIN_URL + 'api.php'
-    TOKEN_URL = MAIN_URL + 'api_token.php'
-    ALL_CATEGORIES_URL = MAIN_URL + 'api_category.php'
-    CATEGORIES_COUNT_URL = MAIN_URL + 'api_count.php'
-    ALL_CATEGORIES_COUNTS_URL = MAIN_URL + 'api_count_global.php'
-
-    HTTP_HEADER = {
-        'User-Agent': 'pyTrivia/' + __version__,
-        'Content-Type': 'application/json'
-    }
+    # raise_on_status=False hands the last response back once retries run out, so it still ends up as an HttpError
+    HTTP_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                         raise_on_status=False)
 
-    def __init__(self):
+    def __init__(self, refresh_categories=False):
         """
         Initializes the pyTrivia client.
-        Performs 2 requests to the OpenTriviaDB API:
+        Performs 2 concurrent requests to the OpenTriviaDB API:
             - Token request
-            - Available categories request
+            - Available categories request (skipped if a fresh local cache exists)
+
+        Parameters
+        ----------
+        refresh_categories : bool, optional
+            Ignores the local categories cache and retrieves them from OpenTriviaDB if True.
 
         Raises
         ------
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
             If the OpenTriviaDB response code is not 0.
         """
-        self.token = self._get_token()
-        self._categories_and_ids = self._get_categories()
-        self._difficulties = ('easy', 'medium', 'hard')
-        self._types = ('multiple', 'boolean')
-
-    @property
-    def categories(self):
-        """
-        Shows all available categories.
+        super().__init__()
+        # a single session keeps connections to OpenTriviaDB alive between requests
+        self._session = requests.Session()
+        self._session.headers.update(self.HTTP_HEADER)
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                                    max_retries=self.HTTP_RETRIES))
+        # both requests are independent, so they share the (thread-safe) connection pool concurrently
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                token = executor.submit(self._get_token)
+                categories_and_ids = executor.submit(self._get_categories, refresh_categories)
+                self.token = token.result()
+                self._categories_and_ids = categories_and_ids.result()
+        except BaseException:  # the caller never gets the client back, so it can't close the session itself
+            self._session.close()
+            raise
 
-        Returns
-        -------
-        tuple
-            Tuple of all valid categories.
-        """
-        return tuple(self._categories_and_ids)  # keys only, which are the category names
+    def __enter__(self):
+        return self
 
-    @property
-    def difficulties(self):
-        """Returns _difficulties. All available difficulties."""
-        return self._difficulties
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    @property
-    def types(self):
-        """Returns _types. All available types."""
-        return self._types
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     def get_questions(self, number=1, category=None, difficulty=None, _type=None):
         """
@@ -144,7 +449,7 @@ class Client:
             If difficulty is not a str in self._difficulties.
             If _type is not a str in self._types.
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
@@ -153,43 +458,20 @@ class Client:
         # number
         if not (isinstance(number, int) and (0 < number <= 50)):
             raise TypeError('Parameter \'number\' must be an int between 1 and 50')
-        # category
-        if category is None:
-            category = ''
-        elif category in self._categories_and_ids:
-            category = '&category=%i' % self._categories_and_ids[category]
-        else:
-            raise TypeError('Parameter \'category\' must be an existing category. '
-                            'Call Client.category to check available categories.')
-        # difficulty
-        if difficulty is None:
-            difficulty = ''
-        elif difficulty in self._difficulties:
-            difficulty = '&difficulty=%s' % difficulty
-        else:
-            raise TypeError('Parameter \'difficulty\' must be one of: %s' % ', '.join(self._difficulties))
-        # _type
-        if _type is None:
-            _type = ''
-        elif _type in self._types:
-            _type = '&type=%s' % _type
-        else:
-            raise TypeError('Parameter \'_type\' must be one of: %s' % ', '.join(self._types))
-
-        api_url = '%s?amount=%i%s%s%s&token=' % (self.API_URL, number, category, difficulty, _type)
+        filters = self._build_api_filters(category, difficulty, _type)
 
         # handle token
         try:
-            json = self._request_resource(api_url + self.token)
+            json = self._request_resource(self._questions_url(number, filters))
         except TokenNotFound:  # get a new token
             self.token = self._get_token()
             # if this throws another TokenNotFound, something is up with the API...
-            json = self._request_resource(api_url + self.token)
+            json = self._request_resource(self._questions_url(number, filters))
         except TokenEmpty:  # reset token
             self.token = self._get_token(reset=True)
             # if this throws another TokenEmpty, something is up with the API...
-            json = self._request_resource(api_url + self.token)
-        return [Question(**question) for question in json['results']]
+            json = self._request_resource(self._questions_url(number, filters))
+        return [Question(*_question_fields(question)) for question in json['results']]
 
     def _get_token(self, reset=False):
         """
@@ -208,27 +490,29 @@ class Client:
         Raises
         ------
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
             If the OpenTriviaDB response code is not 0.
         """
-        if reset:
-            token_url = '%s?command=reset&token=%s' % (self.TOKEN_URL, self.token)
-        else:
-            token_url = '%s?command=request' % self.TOKEN_URL
-        json = self._request_resource(token_url)
+        json = self._request_resource(self._token_url(reset))
         return json['token']
 
-    def _get_categories(self):
+    def _get_categories(self, refresh=False):
         """
         Retrieves all OpenTriviaDB categories and respective ids.
+        Categories are cached locally (CATEGORIES_CACHE_FILE) for CATEGORIES_CACHE_TTL seconds.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Ignores the local cache and retrieves categories from OpenTriviaDB if True.
 
         Raises
         ------
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
@@ -242,17 +526,19 @@ class Client:
         Raises
         ------
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
             If the OpenTriviaDB response code is not 0.
         """
+        if not refresh:
+            categories = self._read_categories_cache()
+            if categories is not None:
+                return categories
         json = self._request_resource(self.ALL_CATEGORIES_URL, response_code=False)
-        # Assumes json is structured as per the OpenTriviaDB documentation.
-        # Any error that arises from "wrong" dictionary keys is because json response was
-        # altered by OpenTriviaDB in the meanwhile.
-        categories = {category['name']: category['id'] for category in json['trivia_categories']}
+        categories = self._parse_categories(json)
+        self._write_categories_cache(categories)
         return categories
 
     def _request_resource(self, url, response_code=True):
@@ -274,29 +560,11 @@ class Client:
         Raises
         ------
         ValueError
-            If the HTTP response body does not contain valid json (request.json error).
+            If the HTTP response body does not contain valid json (json decoding error).
         HttpError
             If the HTTP code is not 200 OK.
         NoResults, InvalidParameter, TokenNotFound, TokenEmpty, UnexpectedResponseCode
             If the OpenTriviaDB response code is not 0.
         """
-        response = requests.get(url, headers=self.HTTP_HEADER)
-        if response.status_code != 200:
-            raise HttpError(response.status_code, response.reason)
-        json = response.json()
-        if response_code:
-            # Assumes json is structured as per the OpenTriviaDB documentation.
-            # Any error that arises from "wrong" dictionary keys is because json response was
-            # altered by OpenTriviaDB in the meanwhile.
-            response_code = json['response_code']
-            if response_code == 1:
-                raise NoResults()
-            elif response_code == 2:
-                raise InvalidParameter()
-            elif response_code == 3:
-                raise TokenNotFound()
-            elif response_code == 4:
-                raise TokenEmpty()
-            elif response_code != 0:
-                raise UnexpectedResponseCode(str(response_code))
-        return json
+        response = self._session.get(url)
+        return self._parse_response(response.status_code, response.reason, response.content, response_code)
@@ -3,14 +3,46 @@
 
 """
 OpenTriviaDB related exceptions.
+
+NoResults, InvalidParameter, TokenNotFound and TokenEmpty carry constant state, so a single instance of each
+(NO_RESULTS, INVALID_PARAMETER, TOKEN_NOT_FOUND, TOKEN_EMPTY) is shared and re-raised by the client.
+Before each raise, the client calls _reset() on them, clearing the traceback, chained exceptions (__context__,
+__cause__) and notes left by previous raises. Their traceback and chaining therefore only reflect the latest
+occurrence, and any notes added by callers are dropped when the instance is raised again.
 """
 
 
 class OpenTriviaDBException(Exception):
     """Base exception class."""
 
+    __slots__ = ('code', 'message', '_str')
+
     def __str__(self):
-        return '[Code %i] %s' % (self.code, self.message)
+        # code and message are constant after __init__, so the formatted string is computed only once
+        try:
+            return self._str
+        except AttributeError:
+            self._str = f'[Code {self.code}] {self.message}'
+            return self._str
+
+    def _reset(self):
+        """
+        Clears what previous raises (and handlers) left on a shared instance, so it can be raised again.
+
+        Returns
+        -------
+        OpenTriviaDBException
+            self.
+        """
+        self.__traceback__ = None
+        self.__context__ = None
+        self.__cause__ = None
+        self.__suppress_context__ = False
+        try:
+            del self.__notes__
+        except AttributeError:
+            pass
+        return self
 
 
 class NoResults(OpenTriviaDBException):
@@ -26,11 +58,16 @@ class NoResults(OpenTriviaDBException):
     message : str
         Exception message.
     """
+    __slots__ = ()
+
     def __init__(self):
         self.code = 1
         self.message = 'Could not return results. The OpenTriviaDB API doesn\'t have enough questions for your query.'
 
 
+NO_RESULTS = NoResults()
+
+
 class InvalidParameter(OpenTriviaDBException):
     """
     Contains an invalid parameter.
@@ -44,11 +81,16 @@ class InvalidParameter(OpenTriviaDBException):
     message : str
         Exception message.
     """
+    __slots__ = ()
+
     def __init__(self):
         self.code = 2
         self.message = 'Contains an invalid parameter. Arguments passed in aren\'t valid.'
 
 
+INVALID_PARAMETER = InvalidParameter()
+
+
 class TokenNotFound(OpenTriviaDBException):
     """
     Session Token does not exist.
@@ -60,11 +102,16 @@ class TokenNotFound(OpenTriviaDBException):
     message : str
         Exception message.
     """
+    __slots__ = ()
+
     def __init__(self):
         self.code = 3
         self.message = 'Session Token does not exist.'
 
 
+TOKEN_NOT_FOUND = TokenNotFound()
+
+
 class TokenEmpty(OpenTriviaDBException):
     """
     Session Token has returned all possible questions for the specified query.
@@ -77,12 +124,17 @@ class TokenEmpty(OpenTriviaDBException):
     message : str
         Exception message.
     """
+    __slots__ = ()
+
     def __init__(self):
         self.code = 4
         self.message = 'Session Token has returned all possible questions for the specified query. ' \
                        'Resetting the Token is necessary.'
 
 
+TOKEN_EMPTY = TokenEmpty()
+
+
 class UnexpectedResponseCode(OpenTriviaDBException):
     """
     Unexpected OpenTriviaDB response code received (not defined in the OpenTriviaDB documentation).
@@ -94,6 +146,8 @@ class UnexpectedResponseCode(OpenTriviaDBException):
     message : str
         Exception message.
     """
+    __slots__ = ()
+
     def __init__(self, code):
         self.code = code
         self.message = 'Unexpected OpenTriviaDB response code received: %s' % code
@@ -113,9 +167,11 @@ class HttpError(OpenTriviaDBException):
     message : str
         HTTP text corresponding to status code.
     """
+    __slots__ = ('status_code',)
+
     def __init__(self, status_code, message):
         self.status_code = status_code
         self.message = message
 
     def __str__(self):
-        return 'Received HTTP status code %i: %s. Expected 200: OK' % (self.status_code, self.message)
+        return f'Received HTTP status code {self.status_code}: {self.message}. Expected 200: OK'
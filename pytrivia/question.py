@@ -7,6 +7,9 @@ Question class - Represents a question retrieved from OpenTriviaDB.
 
 import html
 
+# Unit separator. html.unescape never produces it (&#31; decodes to ''), so it safely delimits batched fields.
+_SEPARATOR = '\x1f'
+
 
 class Question:
     """
@@ -29,6 +32,8 @@ class Question:
         Incorrect answers to question.
     """
 
+    __slots__ = ('category', 'type', 'difficulty', 'question', 'correct_answer', 'incorrect_answers')
+
     def __init__(self, category, type, difficulty, question, correct_answer, incorrect_answers):
         """
         Initializes a question from OpenTriviaDB.
@@ -56,6 +61,11 @@ class Question:
         self.category = category
         self.type = type
         self.difficulty = difficulty
-        self.question = html.unescape(question)
-        self.correct_answer = html.unescape(correct_answer)
-        self.incorrect_answers = [html.unescape(incorrect_answer) for incorrect_answer in incorrect_answers]
+        # unescape every field in a single html.unescape call
+        fields = [question, correct_answer, *incorrect_answers]
+        joined = _SEPARATOR.join(fields)
+        if joined.count(_SEPARATOR) != len(fields) - 1:
+            fields = [html.unescape(field) for field in fields]  # separator already in raw text
+        else:
+            fields = html.unescape(joined).split(_SEPARATOR)
+        self.question, self.correct_answer, *self.incorrect_answers = fields